@@ -0,0 +1,35 @@
+#!/usr/bin/env python3
+"""One-shot converter from the scraper's JSONL output to a JSON array.
+
+The scraper appends one watch per line to data/rolex_watches.jsonl; run
+this afterwards if a consumer needs the original array format.
+"""
+import argparse
+import os
+import orjson
+
+DATA_DIR = "./data"
+WATCHES_JSONL = f"{DATA_DIR}/rolex_watches.jsonl"
+WATCHES_JSON = f"{DATA_DIR}/rolex_watches.json"
+
+def convert(jsonl_file=WATCHES_JSONL, json_file=WATCHES_JSON):
+    """Convert a JSONL file into a pretty-printed JSON array."""
+    if not os.path.exists(jsonl_file):
+        print(f"JSONL file {jsonl_file} not found.")
+        return
+
+    with open(jsonl_file, 'rb') as f:
+        watches = [orjson.loads(line) for line in f if line.strip()]
+
+    with open(json_file, 'wb') as f:
+        f.write(orjson.dumps(watches, option=orjson.OPT_INDENT_2))
+
+    print(f"Converted {len(watches)} watches from {jsonl_file} to {json_file}")
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description='Convert scraper JSONL output to a JSON array')
+    parser.add_argument('--jsonl', default=WATCHES_JSONL, help='Input JSONL file')
+    parser.add_argument('--json', default=WATCHES_JSON, help='Output JSON file')
+    args = parser.parse_args()
+
+    convert(args.jsonl, args.json)
@@ -1,340 +1,655 @@
 #!/usr/bin/env python3
-import json
+import asyncio
 import os
 import time
-import random
-from typing import Dict, List, Optional
-from playwright.sync_api import sync_playwright, Page, TimeoutError
+from typing import Dict, List, Optional, Set
+from urllib.parse import urlparse
+import httpx
+import orjson
+from selectolax.parser import HTMLParser
+from playwright.async_api import async_playwright, Page
 
 # Constants
 MAX_RETRIES = 3
 DATA_DIR = "./data"
 BRANDS_JSON = f"{DATA_DIR}/brands.json"
 WATCHES_JSON = f"{DATA_DIR}/watches.json"
-BATCH_SIZE = 10  # Save batch of watches to avoid data loss in case of errors
+WATCHES_NDJSON = f"{DATA_DIR}/watches.ndjson"
+HTTP_CACHE_JSON = f"{DATA_DIR}/http_cache.json"
+PW_PROFILE_DIR = "./.pw-profile"  # Persistent browser profile across runs
+MAX_CONCURRENCY = 5  # Concurrent watch detail fetches
+MIN_REQUEST_DELTA = 1.5  # Minimum seconds between requests to the same domain
 
-def polite_delay():
-    """Add a random delay between requests to avoid overloading the server."""
-    delay = random.uniform(2, 5)
-    time.sleep(delay)
+USER_AGENT = "Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/91.0.4472.124 Safari/537.36"
+HEADERS = {
+    "User-Agent": USER_AGENT,
+    "Accept-Language": "en-US,en;q=0.9",
+}
 
-def load_brands(filename=BRANDS_JSON):
+# Fallback selectors pre-joined into single selector lists so each field
+# costs one css lookup instead of one per fallback
+NAME_SELECTOR = "#detail-page-dealer h1 span, h1 span, h1"
+PRICE_SELECTOR = ".detail-page-price span, .wt-detail-page-price span, .article-price__price"
+DESCRIPTION_SELECTOR = ".description-text, .article-description, .dealer-listing__description, .detail-page__description"
+SPEC_ROWS_SELECTOR = "table.technical-details tbody > tr, table tbody > tr"
+
+# In-browser extraction function for the Playwright fallback, built once
+# at import from the same selector constants as the HTTP path
+WATCH_EXTRACT_JS = """() => {
+    const text = (sel) => (document.querySelector(sel)?.textContent || '').trim();
+    const out = {
+        name: text('%(name)s'),
+        price: text('%(price)s'),
+        description: text('%(description)s'),
+        specs: []
+    };
+    for (const row of document.querySelectorAll('%(spec_rows)s')) {
+        out.specs.push([
+            (row.querySelector('th, td:first-child')?.textContent || '').trim(),
+            (row.querySelector('td:last-child, td:nth-child(2)')?.textContent || '').trim()
+        ]);
+    }
+    return out;
+}""" % {
+    "name": NAME_SELECTOR,
+    "price": PRICE_SELECTOR,
+    "description": DESCRIPTION_SELECTOR,
+    "spec_rows": SPEC_ROWS_SELECTOR,
+}
+
+# Resources the text extractors never touch; aborting them cuts most of a
+# page's bytes and lets load states settle much earlier
+BLOCKED_RESOURCE_TYPES = {"image", "font", "stylesheet", "media", "other"}
+BLOCKED_HOSTS = (
+    "google-analytics.com",
+    "googletagmanager.com",
+    "doubleclick.net",
+    "facebook.net",
+    "hotjar.com",
+)
+
+class RateLimiter:
+    """Per-domain request spacing shared by all concurrent workers.
+
+    Tracks when the next request to each domain may start and sleeps only
+    the remaining deficit, so a worker that arrives late (e.g. after a
+    retry backoff) doesn't sleep at all, while bursts are still spread
+    MIN_REQUEST_DELTA apart.
+    """
+
+    def __init__(self, delta: float = MIN_REQUEST_DELTA):
+        self.delta = delta
+        self._next_ok: Dict[str, float] = {}
+        self._lock = asyncio.Lock()
+
+    async def wait(self, url: str) -> None:
+        """Block until a request to this URL's domain is allowed."""
+        domain = urlparse(url).netloc
+        async with self._lock:
+            now = time.monotonic()
+            start_at = max(now, self._next_ok.get(domain, 0.0))
+            self._next_ok[domain] = start_at + self.delta
+        delay = start_at - now
+        if delay > 0:
+            await asyncio.sleep(delay)
+
+rate_limiter = RateLimiter()
+
+class ValidatorCache:
+    """ETag/Last-Modified validators per URL for conditional re-fetches.
+
+    Pages that haven't changed since the last run answer 304 with an empty
+    body, skipping both the transfer and the parse.
+    """
+
+    def __init__(self, filename: str = HTTP_CACHE_JSON):
+        self.filename = filename
+        self._validators: Dict[str, Dict[str, Optional[str]]] = {}
+        if os.path.exists(filename):
+            try:
+                with open(filename, 'rb') as f:
+                    self._validators = orjson.loads(f.read())
+            except orjson.JSONDecodeError:
+                # A corrupt cache is safe to drop; the affected pages are
+                # simply refetched in full once
+                print(f"Ignoring corrupt HTTP cache {filename}")
+
+    def has(self, url: str) -> bool:
+        """Whether validators are stored for this URL."""
+        return url in self._validators
+
+    def conditional_headers(self, url: str) -> Dict[str, str]:
+        """Headers making the request conditional on the stored validators."""
+        validators = self._validators.get(url)
+        if not validators:
+            return {}
+        headers = {}
+        if validators.get("etag"):
+            headers["If-None-Match"] = validators["etag"]
+        if validators.get("last_modified"):
+            headers["If-Modified-Since"] = validators["last_modified"]
+        return headers
+
+    def update(self, url: str, response: httpx.Response) -> None:
+        """Remember the validators a successful response carried."""
+        etag = response.headers.get("ETag")
+        last_modified = response.headers.get("Last-Modified")
+        if etag or last_modified:
+            self._validators[url] = {"etag": etag, "last_modified": last_modified}
+
+    def save(self) -> None:
+        os.makedirs(os.path.dirname(self.filename), exist_ok=True)
+        with open(self.filename, 'wb') as f:
+            f.write(orjson.dumps(self._validators))
+
+validator_cache = ValidatorCache()
+
+def load_brands(filename: str = BRANDS_JSON) -> List[Dict]:
     """Load brand data from JSON file."""
     if not os.path.exists(filename):
         print(f"Brands file {filename} not found.")
         return []
-    
-    with open(filename, 'r', encoding='utf-8') as f:
-        return json.load(f)
-
-def save_watches_to_json(watches, filename=WATCHES_JSON):
-    """Save watch data to a JSON file."""
-    os.makedirs(os.path.dirname(filename), exist_ok=True)
-    
-    with open(filename, 'w', encoding='utf-8') as f:
-        json.dump(watches, f, indent=2, ensure_ascii=False)
-    
-    print(f"Watch data ({len(watches)} watches) saved to {filename}")
-
-def extract_specs(page: Page) -> Dict[str, str]:
-    """Extract specifications (key-value pairs) from watch detail page."""
-    specs = {}
-    
-    # Try to find the specs tables
-    tables_selectors = [
-        "#js-200cae34-2927-48bc-ad55-f54431064ebf-0 > section > div > div:nth-child(1) > table",
-        "#js-200cae34-2927-48bc-ad55-f54431064ebf-0 > section > div > div:nth-child(2) > table",
-        "table.technical-details",  # More general fallback
-        "table"  # Most general fallback
-    ]
-    
-    for selector in tables_selectors:
-        try:
-            tables = page.query_selector_all(selector)
-            if tables:
-                for table in tables:
-                    rows = table.query_selector_all("tbody > tr")
-                    for row in rows:
-                        # Try different selectors for key and value
-                        key_element = row.query_selector("th") or row.query_selector("td:first-child")
-                        value_element = row.query_selector("td:last-child") or row.query_selector("td:nth-child(2)")
-                        
-                        if key_element and value_element:
-                            key = key_element.text_content().strip()
-                            value = value_element.text_content().strip()
-                            if key:
-                                specs[key] = value
-        except Exception as e:
-            print(f"Error extracting specs with selector {selector}: {e}")
-    
-    return specs
 
-def extract_description(page: Page) -> str:
-    """Extract watch description from detail page."""
-    description = ""
-    
-    # Try different selectors for description
-    description_selectors = [
-        ".description-text",
-        ".article-description",
-        ".dealer-listing__description", # Another possible selector
-        ".detail-page__description"     # Another possible selector
-    ]
-    
-    for selector in description_selectors:
-        try:
-            desc_element = page.query_selector(selector)
-            if desc_element:
-                description = desc_element.text_content().strip()
-                if description:
-                    break
-        except Exception as e:
-            print(f"Error extracting description with selector {selector}: {e}")
-    
-    return description
+    # orjson parses the UTF-8 bytes directly, skipping a decode pass
+    with open(filename, 'rb') as f:
+        return orjson.loads(f.read())
 
-def process_watch_detail(page: Page, watch_url: str) -> Optional[Dict]:
-    """Process a watch detail page and extract all required information."""
-    try:
-        # Navigate to the watch detail page
-        page.goto(watch_url)
-        page.wait_for_load_state("networkidle")
-        
-        # Extract watch name
-        watch_name = ""
-        name_selectors = [
-            "#detail-page-dealer > section.data.m-b-7.m-b-md-9 > div > div > div.col-xs-24.col-sm-12.col-md-10 > div:nth-child(2) > h1 > span",
-            "h1 span",  # More general fallback
-            "h1"        # Most general fallback
-        ]
-        
-        for selector in name_selectors:
-            try:
-                name_element = page.query_selector(selector)
-                if name_element:
-                    watch_name = name_element.text_content().strip()
-                    if watch_name:
-                        break
-            except Exception:
+class NDJSONWriter:
+    """Append-only writer for the NDJSON output, holding O(1) state.
+
+    One record per line through a single long-lived handle; per-watch cost
+    stays constant no matter how large the scrape grows, and nothing is
+    held in memory. compact_ndjson_to_json converts to an array at the end.
+    """
+
+    def __init__(self, filename: str = WATCHES_NDJSON):
+        os.makedirs(os.path.dirname(filename), exist_ok=True)
+        # Terminate a torn final line left by a crash mid-append, so the
+        # first new record doesn't fuse onto it; load_scraped_urls skips
+        # the isolated tail
+        if os.path.exists(filename):
+            with open(filename, 'rb+') as f:
+                f.seek(0, os.SEEK_END)
+                if f.tell() > 0:
+                    f.seek(-1, os.SEEK_END)
+                    if f.read(1) != b'\n':
+                        f.write(b'\n')
+        self._f = open(filename, 'ab')
+
+    def write(self, record: Dict) -> None:
+        # Flush per record so a crash loses at most the write in flight
+        self._f.write(orjson.dumps(record) + b'\n')
+        self._f.flush()
+
+    def close(self) -> None:
+        self._f.close()
+
+def load_scraped_urls(filename: str = WATCHES_NDJSON) -> Set[str]:
+    """Load URLs already written to the NDJSON output by earlier runs."""
+    urls = set()
+    if os.path.exists(filename):
+        with open(filename, 'rb') as f:
+            for line in f:
+                if not line.strip():
+                    continue
+                try:
+                    url = orjson.loads(line).get("url")
+                except orjson.JSONDecodeError:
+                    # A crash mid-append leaves a torn final line; skip it
+                    # so the watch is simply re-fetched
+                    continue
+                if url:
+                    urls.add(url)
+    return urls
+
+def compact_ndjson_to_json(ndjson_file: str = WATCHES_NDJSON, json_file: str = WATCHES_JSON) -> None:
+    """One-shot post-processor: convert the NDJSON stream to a JSON array.
+
+    Revalidated watches are appended again as replacement records, so the
+    last record per URL wins here.
+    """
+    if not os.path.exists(ndjson_file):
+        return
+
+    watches_by_url: Dict[str, Dict] = {}
+    with open(ndjson_file, 'rb') as f:
+        for line in f:
+            if not line.strip():
                 continue
-        
-        # Extract price
-        price = ""
-        price_selectors = [
-            "#detail-page-dealer > section.data.m-b-7.m-b-md-9 > div > div > div.col-xs-24.col-sm-12.col-md-10 > div:nth-child(3) > div.detail-page-price.wt-detail-page-price > span > span",
-            ".detail-page-price span",  # More general fallback
-            ".wt-detail-page-price span",  # Alternative
-            ".article-price__price"      # Another possible selector
-        ]
-        
-        for selector in price_selectors:
             try:
-                price_element = page.query_selector(selector)
-                if price_element:
-                    price = price_element.text_content().strip()
-                    if price:
-                        break
-            except Exception:
+                record = orjson.loads(line)
+            except orjson.JSONDecodeError:
                 continue
-        
-        # Extract description
-        description = extract_description(page)
-        
-        # Extract specifications
-        specs = extract_specs(page)
-        
+            watches_by_url[record.get("url") or str(len(watches_by_url))] = record
+    watches = list(watches_by_url.values())
+
+    with open(json_file, 'wb') as f:
+        f.write(orjson.dumps(watches, option=orjson.OPT_INDENT_2))
+
+    print(f"Watch data ({len(watches)} watches) saved to {json_file}")
+
+def make_absolute_url(href: str) -> str:
+    """Make a watch URL absolute if needed."""
+    if not href.startswith("http"):
+        return f"https://www.chrono24.com{href}"
+    return href
+
+def extract_specs(tree: HTMLParser) -> Dict[str, str]:
+    """Extract specifications (key-value pairs) from parsed detail page HTML."""
+    specs = {}
+
+    # One descendant-selector pass over all spec rows, no per-table nesting
+    for row in tree.css(SPEC_ROWS_SELECTOR):
+        key_node = row.css_first("th") or row.css_first("td:first-child")
+        value_node = row.css_first("td:last-child") or row.css_first("td:nth-child(2)")
+
+        if key_node and value_node:
+            key = key_node.text(strip=True)
+            value = value_node.text(strip=True)
+            if key:
+                specs[key] = value
+
+    return specs
+
+def extract_description(tree: HTMLParser) -> str:
+    """Extract watch description from parsed detail page HTML."""
+    desc_node = tree.css_first(DESCRIPTION_SELECTOR)
+    if desc_node:
+        return desc_node.text(strip=True)
+    return ""
+
+def parse_watch_detail(html: str, watch_url: str) -> Optional[Dict]:
+    """Parse a watch detail page's HTML and extract all required information.
+
+    Returns None if the page doesn't look like a rendered detail page
+    (no watch name), so callers can fall back to a real browser.
+    """
+    tree = HTMLParser(html)
+
+    # Extract watch name
+    name_node = tree.css_first(NAME_SELECTOR)
+    watch_name = name_node.text(strip=True) if name_node else ""
+
+    if not watch_name:
+        return None
+
+    # Extract price
+    price_node = tree.css_first(PRICE_SELECTOR)
+    price = price_node.text(strip=True) if price_node else ""
+
+    # Create watch data object
+    return {
+        "url": watch_url,
+        "name": watch_name,
+        "price": price,
+        "description": extract_description(tree),
+        "specifications": extract_specs(tree)
+    }
+
+def parse_listing_page(html: str) -> Optional[List[str]]:
+    """Parse a listing page's HTML and extract all watch URLs.
+
+    Returns None when the watch container is missing entirely (the page
+    likely needs JS to render), as opposed to an empty list for a present
+    but empty container, which is just the end of pagination.
+    """
+    tree = HTMLParser(html)
+    if tree.css_first("#wt-watches") is None:
+        return None
+
+    watch_urls = []
+    for link in tree.css("#wt-watches a"):
+        href = link.attributes.get("href")
+        if href:
+            href = make_absolute_url(href)
+            if href not in watch_urls:
+                watch_urls.append(href)
+
+    return watch_urls
+
+async def process_watch_detail(page: Page, watch_url: str) -> Optional[Dict]:
+    """Process a watch detail page in the browser fallback."""
+    try:
+        # Navigate to the watch detail page; DOM-parsed is enough for text
+        # extraction, so don't wait for the full networkidle tail
+        await page.goto(watch_url, wait_until="domcontentloaded")
+        await page.wait_for_selector("h1", timeout=10000)
+
+        # Extract name, price, description and specs in one page.evaluate
+        # call; the JS body is compiled once at import (WATCH_EXTRACT_JS).
+        # Specs come back as a flat [key, value] array and are paired up here.
+        extracted = await page.evaluate(WATCH_EXTRACT_JS)
+        specs = {key: value for key, value in extracted["specs"] if key}
+
         # Create watch data object
         watch_data = {
             "url": watch_url,
-            "name": watch_name,
-            "price": price,
-            "description": description,
+            "name": extracted["name"],
+            "price": extracted["price"],
+            "description": extracted["description"],
             "specifications": specs
         }
-        
-        print(f"Extracted: {watch_name} ({price})")
+
+        print(f"Extracted: {watch_data['name']} ({watch_data['price']})")
         return watch_data
-    
+
     except Exception as e:
         print(f"Error processing watch detail page {watch_url}: {e}")
         return None
 
-def process_listing_page(page: Page, page_url: str) -> List[str]:
-    """Process a brand listing page and extract all watch URLs."""
+async def process_listing_page(page: Page, page_url: str) -> List[str]:
+    """Process a brand listing page in the browser fallback."""
     watch_urls = []
-    
+
     try:
-        # Navigate to the listing page
-        page.goto(page_url)
-        page.wait_for_load_state("networkidle", timeout=30000)
-        
-        # Wait for watch listings to appear
-        page.wait_for_selector("#wt-watches", timeout=30000)
-        
-        # Extract all watch listing links
-        n = 1
-        while True:
-            # Try to find the nth child
-            selector = f"#wt-watches > div:nth-child({n}) > a"
-            link = page.query_selector(selector)
-            
-            if not link:
-                break  # No more children found
-            
-            href = link.get_attribute("href")
-            if href and href not in watch_urls:
-                # Make the URL absolute if needed
-                if not href.startswith("http"):
-                    href = f"https://www.chrono24.com{href}"
-                watch_urls.append(href)
-            
-            n += 1
-        
+        # Navigate to the listing page and wait only for the watch container
+        await page.goto(page_url, wait_until="domcontentloaded")
+        await page.wait_for_selector("#wt-watches", timeout=30000)
+
+        # Pull every listing link in one round-trip instead of probing
+        # nth-child(n) until a miss
+        hrefs = await page.eval_on_selector_all(
+            "#wt-watches > div > a",
+            "els => els.map(e => e.getAttribute('href'))"
+        )
+
+        for href in hrefs:
+            if href:
+                href = make_absolute_url(href)
+                if href not in watch_urls:
+                    watch_urls.append(href)
+
         print(f"Found {len(watch_urls)} watch listings on page {page_url}")
         return watch_urls
-    
+
     except Exception as e:
         print(f"Error processing listing page {page_url}: {e}")
         return []
 
-def process_brand(page: Page, brand: Dict) -> List[Dict]:
-    """Process all pages for a brand and extract watch details."""
-    all_watches = []
+async def _abort_unneeded_resources(route):
+    """Abort image/font/style/tracker requests in the browser fallback."""
+    request = route.request
+    if request.resource_type in BLOCKED_RESOURCE_TYPES:
+        await route.abort()
+    elif any(host in request.url for host in BLOCKED_HOSTS):
+        await route.abort()
+    else:
+        await route.continue_()
+
+class PlaywrightFallback:
+    """Lazily-launched headless browser for pages the HTTP path can't parse.
+
+    Most Chrono24 pages are server-rendered, so plain HTTP + selectolax
+    handles them; only pages that come back without recognisable content
+    (e.g. a JS challenge) are retried here.
+    """
+
+    def __init__(self, pool_size: int = MAX_CONCURRENCY):
+        self._pw = None
+        self._context = None
+        self._pool_size = pool_size
+        self._pages = None
+        self._start_lock = asyncio.Lock()
+
+    async def _ensure_started(self):
+        if self._context is not None:
+            return
+        # Serialize startup: several workers can hit the fallback at once,
+        # and a double launch_persistent_context on the same profile dir
+        # fails on Chromium's singleton lock and leaks the loser's driver
+        async with self._start_lock:
+            if self._context is not None:
+                return
+            self._pw = await async_playwright().start()
+            # A persistent profile keeps cookies, consent state and bot
+            # tokens across runs, so repeat runs skip the cold-start dance
+            context = await self._pw.chromium.launch_persistent_context(
+                PW_PROFILE_DIR,
+                headless=True,
+                viewport={"width": 1920, "height": 1080},
+                user_agent=USER_AGENT
+            )
+            # Abort requests for resources we never read
+            await context.route("**/*", _abort_unneeded_resources)
+            # Pre-create a fixed pool of pages; creating a page per URL
+            # costs hundreds of ms of Chromium target churn
+            self._pages = asyncio.Queue()
+            for _ in range(self._pool_size):
+                await self._pages.put(await context.new_page())
+            # Publish only once fully set up, so the fast path above never
+            # sees a half-initialized fallback
+            self._context = context
+
+    async def fetch_watch_detail(self, watch_url: str) -> Optional[Dict]:
+        """Render and extract a watch detail page in the browser."""
+        await self._ensure_started()
+        page = await self._pages.get()
+        try:
+            return await process_watch_detail(page, watch_url)
+        finally:
+            self._pages.put_nowait(page)
+
+    async def fetch_listing_page(self, page_url: str) -> List[str]:
+        """Render a listing page in the browser and extract watch URLs."""
+        await self._ensure_started()
+        page = await self._pages.get()
+        try:
+            return await process_listing_page(page, page_url)
+        finally:
+            self._pages.put_nowait(page)
+
+    async def close(self):
+        if self._context is not None:
+            await self._context.close()
+            await self._pw.stop()
+            self._context = None
+
+async def fetch_watch_detail(client: httpx.AsyncClient, fallback: PlaywrightFallback,
+                             watch_url: str, seen_urls: Set[str]) -> Optional[Dict]:
+    """Fetch and parse one watch detail page with retries."""
+    retry_count = 0
+    while retry_count < MAX_RETRIES:
+        try:
+            await rate_limiter.wait(watch_url)
+            # Conditional only when a record for this URL is on disk; a 304
+            # must never stand in for a record we don't actually have
+            conditional = (validator_cache.conditional_headers(watch_url)
+                           if watch_url in seen_urls else {})
+            response = await client.get(watch_url, headers=conditional)
+            if response.status_code == 304:
+                # Unchanged since last run; the existing record stands
+                print(f"Not modified, keeping existing record: {watch_url}")
+                return None
+            response.raise_for_status()
+
+            watch_data = parse_watch_detail(response.text, watch_url)
+            if watch_data is None:
+                # Page didn't render server-side; retry in a real browser
+                print(f"No content via HTTP for {watch_url}, using browser fallback")
+                return await fallback.fetch_watch_detail(watch_url)
+
+            # Remember validators only for responses that produced a record,
+            # so later 304s always have something written to fall back on
+            validator_cache.update(watch_url, response)
+
+            print(f"Extracted: {watch_data['name']} ({watch_data['price']})")
+            return watch_data
+        except Exception as e:
+            retry_count += 1
+            print(f"Retry {retry_count}/{MAX_RETRIES} for {watch_url}: {e}")
+            if retry_count == MAX_RETRIES:
+                print(f"Failed to process {watch_url} after {MAX_RETRIES} retries")
+    return None
+
+async def fetch_listing_page(client: httpx.AsyncClient, fallback: PlaywrightFallback,
+                             page_url: str) -> List[str]:
+    """Fetch and parse one listing page, falling back to the browser if empty."""
+    await rate_limiter.wait(page_url)
+    response = await client.get(page_url)
+    response.raise_for_status()
+
+    watch_urls = parse_listing_page(response.text)
+    if watch_urls is None:
+        # Watch container missing entirely: the page needs a real browser
+        print(f"No watch container via HTTP for {page_url}, using browser fallback")
+        watch_urls = await fallback.fetch_listing_page(page_url)
+    elif not watch_urls:
+        # Container present but empty: plain end of pagination
+        print(f"No watch listings on page {page_url}")
+    else:
+        print(f"Found {len(watch_urls)} watch listings on page {page_url}")
+
+    return watch_urls
+
+async def process_brand(client: httpx.AsyncClient, fallback: PlaywrightFallback,
+                        brand: Dict, seen_urls: Set[str], writer: NDJSONWriter) -> int:
+    """Process all pages for a brand, streaming watch details to the writer.
+
+    Returns the number of watches written.
+    """
+    watch_count = 0
     all_watch_urls = set()  # Use a set to avoid duplicates
-    
-    try:
-        brand_name = brand["name"]
-        brand_base_url = brand["url"].replace("/index.htm", "")
-        
-        print(f"\nProcessing brand: {brand_name}")
-        
-        # Start with page 1
+    url_queue: asyncio.Queue = asyncio.Queue()
+
+    brand_name = brand["name"]
+    brand_base_url = brand["url"].replace("/index.htm", "")
+
+    print(f"\nProcessing brand: {brand_name}")
+
+    async def produce_listing_urls():
+        """Paginate listing pages and feed new watch URLs to the queue."""
         page_index = 1
-        has_more_pages = True
-        
-        while has_more_pages:
+
+        while True:
             page_url = f"{brand_base_url}/index-{page_index}.htm" if page_index > 1 else f"{brand_base_url}/index.htm"
             print(f"Processing page {page_index}: {page_url}")
-            
+
             # Try to process the page with retries
             retry_count = 0
             watch_urls = []
-            
+
             while retry_count < MAX_RETRIES:
                 try:
-                    watch_urls = process_listing_page(page, page_url)
+                    watch_urls = await fetch_listing_page(client, fallback, page_url)
                     break
                 except Exception as e:
                     retry_count += 1
                     print(f"Retry {retry_count}/{MAX_RETRIES} for {page_url}: {e}")
                     if retry_count == MAX_RETRIES:
                         print(f"Failed to process {page_url} after {MAX_RETRIES} retries")
-                    polite_delay()
-            
+
             # Check if we found any new watches
             new_urls = [url for url in watch_urls if url not in all_watch_urls]
-            
+
             if not new_urls:
                 # No new watches found, we've reached the end of pagination
                 print(f"No new watches found on page {page_index}, stopping pagination")
-                has_more_pages = False
-            else:
-                # Add new URLs to our set
-                all_watch_urls.update(new_urls)
-                
-                # Process each watch URL
-                for watch_url in new_urls:
-                    polite_delay()
-                    retry_count = 0
-                    
-                    while retry_count < MAX_RETRIES:
-                        try:
-                            watch_data = process_watch_detail(page, watch_url)
-                            if watch_data:
-                                watch_data["brand"] = brand_name
-                                all_watches.append(watch_data)
-                                
-                                # Save batch to avoid data loss in case of errors
-                                if len(all_watches) % BATCH_SIZE == 0:
-                                    print(f"Saving batch of {len(all_watches)} watches...")
-                                    save_watches_to_json(all_watches)
-                            
-                            break  # Break retry loop if successful
-                        except Exception as e:
-                            retry_count += 1
-                            print(f"Retry {retry_count}/{MAX_RETRIES} for {watch_url}: {e}")
-                            if retry_count == MAX_RETRIES:
-                                print(f"Failed to process {watch_url} after {MAX_RETRIES} retries")
-                            polite_delay()
-                
-                # Move to next page
-                page_index += 1
-    
+                break
+
+            # Add new URLs to our set
+            all_watch_urls.update(new_urls)
+
+            # Skip watches already scraped in earlier runs, except those
+            # with stored validators: those get a cheap conditional GET
+            # (304 keeps the record, 200 replaces it)
+            fetch_urls = [url for url in new_urls
+                          if url not in seen_urls or validator_cache.has(url)]
+            skipped = len(new_urls) - len(fetch_urls)
+            if skipped:
+                print(f"Skipping {skipped} already-scraped watches on page {page_index}")
+
+            for url in fetch_urls:
+                await url_queue.put(url)
+
+            page_index += 1
+
+    async def consume_watch_urls():
+        """Drain the queue, fetching detail pages and writing results."""
+        nonlocal watch_count
+
+        while True:
+            watch_url = await url_queue.get()
+            try:
+                watch_data = await fetch_watch_detail(client, fallback, watch_url, seen_urls)
+                if watch_data:
+                    watch_data["brand"] = brand_name
+                    writer.write(watch_data)
+                    watch_count += 1
+                    seen_urls.add(watch_data["url"])
+            except Exception as e:
+                print(f"Error processing watch {watch_url}: {e}")
+            finally:
+                url_queue.task_done()
+
+    try:
+        # One producer paginates while the consumers drain detail URLs, so
+        # detail fetching starts as soon as the first page is listed
+        consumers = [
+            asyncio.create_task(consume_watch_urls())
+            for _ in range(MAX_CONCURRENCY)
+        ]
+        try:
+            await produce_listing_urls()
+            await url_queue.join()
+        finally:
+            for consumer in consumers:
+                consumer.cancel()
+            await asyncio.gather(*consumers, return_exceptions=True)
+
     except Exception as e:
         print(f"Error processing brand {brand['name']}: {e}")
-    
-    return all_watches
 
-def main():
+    return watch_count
+
+async def main():
     """Main function to orchestrate the watch extraction process."""
     # Create data directory if needed
     os.makedirs(DATA_DIR, exist_ok=True)
-    
+
     # Load brands
     brands = load_brands()
     if not brands:
         print("No brands found. Please run extract_brands.py first.")
         return
-    
+
     print(f"Loaded {len(brands)} brands")
-    
-    # Initialize watches list
-    all_watches = []
-    
-    # Launch Playwright browser
-    with sync_playwright() as pw:
-        browser = pw.chromium.launch(
-            headless=False,  # Set to True for production
-            slow_mo=50  # Slow down actions for visibility during development
-        )
-        
-        # Create a new browser context with a realistic viewport
-        context = browser.new_context(
-            viewport={"width": 1920, "height": 1080},
-            user_agent="Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/91.0.4472.124 Safari/537.36"
-        )
-        
-        # Create a new page
-        page = context.new_page()
-        
+
+    # URLs scraped by earlier runs; re-runs only fetch the delta
+    seen_urls = load_scraped_urls()
+    if seen_urls:
+        print(f"Resuming: {len(seen_urls)} watches already scraped")
+
+    # Stream watches straight to disk instead of accumulating them
+    writer = NDJSONWriter()
+    total_watches = 0
+
+    fallback = PlaywrightFallback()
+
+    async with httpx.AsyncClient(http2=True, headers=HEADERS,
+                                 follow_redirects=True, timeout=30.0) as client:
         try:
             # Process only a subset of brands for testing
             # Remove [:3] to process all brands
             for brand in brands[:3]:
-                brand_watches = process_brand(page, brand)
-                all_watches.extend(brand_watches)
-                
-                # Save after each brand to avoid data loss
-                if brand_watches:
-                    save_watches_to_json(all_watches)
-            
-            # Final save
-            if all_watches:
-                save_watches_to_json(all_watches)
-                print(f"Extracted a total of {len(all_watches)} watches from {len(brands)} brands")
+                total_watches += await process_brand(client, fallback, brand,
+                                                     seen_urls, writer)
+
+            if total_watches:
+                print(f"Extracted a total of {total_watches} watches from {len(brands)} brands")
             else:
                 print("No watches were extracted")
-        
+
         except Exception as e:
             print(f"Error in main process: {e}")
-            # Save whatever watches we've collected so far
-            if all_watches:
-                save_watches_to_json(all_watches)
-        
+
         finally:
+            # Watches are already appended to NDJSON as we go; produce the
+            # JSON array for downstream consumers
+            writer.close()
+            compact_ndjson_to_json()
+            validator_cache.save()
             # Clean up
-            context.close()
-            browser.close()
+            await fallback.close()
 
 if __name__ == "__main__":
-    main() 
\ No newline at end of file
+    asyncio.run(main())
@@ -1,16 +1,19 @@
 #!/usr/bin/env python3
-import json
 import os
 import time
 import random
-import sys
 import logging
-import re
 import asyncio
+import sqlite3
+import multiprocessing
+import orjson
+import httpx
 from typing import Dict, List, Optional, Set
 from urllib.parse import urlparse, urljoin
-from playwright.sync_api import sync_playwright, Page, TimeoutError
+from selectolax.parser import HTMLParser
+from playwright.async_api import async_playwright, Page, TimeoutError
 from functools import wraps
+from contextlib import asynccontextmanager
 import argparse
 
 # Configure logging
@@ -22,10 +25,17 @@ logging.basicConfig(
 # Constants
 DATA_DIR = "./data"
 BRANDS_JSON = f"{DATA_DIR}/brands.json"
-WATCHES_JSON = f"{DATA_DIR}/rolex_watches.json"
+WATCHES_JSONL = f"{DATA_DIR}/rolex_watches.jsonl"
 BASE_URL = "https://www.chrono24.com"
 ERRORS_DIR = f"{DATA_DIR}/errors"
-PROGRESS_DIR = f"{DATA_DIR}/progress"
+PROGRESS_DB = f"{DATA_DIR}/progress.db"
+MIN_REQUEST_INTERVAL = 0.5  # Seconds between outbound requests, globally
+
+USER_AGENT = "Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/91.0.4472.124 Safari/537.36"
+HTTP_HEADERS = {
+    "User-Agent": USER_AGENT,
+    "Accept-Language": "en-US,en;q=0.9",
+}
 
 # Centralized CSS Selectors
 SELECTORS = {
@@ -34,151 +44,357 @@ SELECTORS = {
     "LISTING_LINK_ALL": "#wt-watches a",
     "DETAIL_NAME": "#detail-page-dealer section.data h1 span",
     "DETAIL_PRICE": ".detail-page-price span",
-    "DETAIL_DESC": [
+    "DETAIL_DESC": (
         "#detail-page-dealer section.data .description-text",
         "#detail-page-dealer section.data .article-description",
         ".dealer-listing__description",
         ".detail-page__description"
-    ],
-    "SPEC_TABLES": [
+    ),
+    "SPEC_TABLES": (
         "#detail-page-dealer section.data table",
         "#detail-page-dealer section.data div table",
         "table.technical-details",
         "table"
-    ]
+    )
+}
+
+# Selector variant tuples pre-joined once at import: a comma-joined group
+# lets one querySelectorAll/css pass cover all the variants instead of a
+# per-selector loop with its own DOM walk each. Passed whole as the single
+# argument to the in-browser extraction.
+SELECTORS_COMBINED = {
+    key: ", ".join(value) if isinstance(value, tuple) else value
+    for key, value in SELECTORS.items()
 }
 
+# In-browser extraction of a whole detail page in one evaluate call.
+# Receives SELECTORS_COMBINED as its single argument so the JS stays in
+# sync with SELECTORS; returns {name, price, description, specs}.
+WATCH_EXTRACT_JS = """(sel) => {
+    const clean = (s) => (s || '').trim();
+    const text = (q) => clean(document.querySelector(q)?.textContent);
+
+    const description = text(sel.DETAIL_DESC);
+
+    const specs = {};
+    for (const table of document.querySelectorAll(sel.SPEC_TABLES)) {
+        for (const row of table.querySelectorAll('tbody > tr')) {
+            const key = clean(row.querySelector('th, td:first-child')?.textContent);
+            let value = clean(row.querySelector('td:last-child, td:nth-child(2)')?.textContent);
+            // Remove embedded JS loader code; a plain substring scan,
+            // no regex engine needed for a prefix cut
+            const loaderAt = value.indexOf('function docReady');
+            if (loaderAt >= 0) value = value.slice(0, loaderAt).trim();
+
+            // Skip the generic header row and the header-like
+            // "Description" row (not the real description content)
+            const keyLower = key.toLowerCase();
+            if (keyLower === 'basic info') continue;
+            if (keyLower === 'description' && value.toLowerCase() === 'description') continue;
+
+            if (key) specs[key] = value;
+        }
+    }
+
+    return {
+        name: text(sel.DETAIL_NAME) || text('h1'),
+        price: text(sel.DETAIL_PRICE),
+        description: description,
+        specs: specs
+    };
+}"""
+
+# Resource types the selectors never read; aborting them cuts page weight
+# and stops trackers from holding load states open
+BLOCKED_RESOURCE_TYPES = {"image", "font", "media", "stylesheet", "websocket"}
+BLOCKED_HOSTS = (
+    "google-analytics.com",
+    "googletagmanager.com",
+    "doubleclick.net",
+    "facebook.net",
+    "hotjar.com",
+)
+
+async def abort_unneeded_resources(route):
+    """Route handler aborting resource types and tracker hosts we never use."""
+    request = route.request
+    if request.resource_type in BLOCKED_RESOURCE_TYPES:
+        await route.abort()
+    elif any(host in request.url for host in BLOCKED_HOSTS):
+        await route.abort()
+    else:
+        await route.continue_()
+
 def with_retry(max_retries=3, backoff_factor=2):
-    """Decorator for retrying operations with exponential backoff."""
+    """Decorator for retrying async operations with exponential backoff."""
     def decorator(func):
         @wraps(func)
-        def wrapper(*args, **kwargs):
+        async def wrapper(*args, **kwargs):
             retries = 0
             last_exception = None
-            
+
             while retries < max_retries:
                 try:
-                    return func(*args, **kwargs)
+                    return await func(*args, **kwargs)
                 except Exception as e:
                     last_exception = e
                     retries += 1
                     sleep_time = backoff_factor ** retries
                     logging.warning(f"Attempt {retries}/{max_retries} failed: {e}. Retrying in {sleep_time}s")
-                    time.sleep(sleep_time)
-            
+                    await asyncio.sleep(sleep_time)
+
             # If we get here, all retries failed
             raise last_exception
         return wrapper
     return decorator
 
-def get_pagination_url(base_url: str, page_num: int) -> str:
-    """Generate pagination URL using proper URL parsing."""
-    parsed_url = urlparse(base_url)
-    
-    # Handle different pagination patterns
-    if page_num == 1:
-        return base_url
-        
-    # Try to identify the pagination pattern
-    path = parsed_url.path
-    if path.endswith('index.htm'):
-        # Handle standard pattern
-        base_path = path[:-9]  # Remove 'index.htm'
-        new_path = f"{base_path}index-{page_num}.htm"
-    elif path.endswith('/'):
-        # Handle path ending with slash
-        new_path = f"{path}index-{page_num}.htm"
-    else:
-        # Handle path without special ending
-        new_path = f"{path}/index-{page_num}.htm"
-    
-    # Reconstruct the URL
-    pagination_url = f"{parsed_url.scheme}://{parsed_url.netloc}{new_path}"
-    if parsed_url.query:
-        pagination_url += f"?{parsed_url.query}"
-        
-    return pagination_url
+class PaginationURL:
+    """Pagination URL generator that parses the brand base URL once.
+
+    urlparse is surprisingly heavy for something called per page with a
+    constant input; the prefix and suffix are precomputed so page() is a
+    single f-string.
+    """
+
+    def __init__(self, base_url: str):
+        self.base_url = base_url
+        parsed_url = urlparse(base_url)
+
+        # Identify the pagination pattern once
+        path = parsed_url.path
+        if path.endswith('index.htm'):
+            # Standard pattern
+            base_path = path[:-9]  # Remove 'index.htm'
+        elif path.endswith('/'):
+            # Path ending with slash
+            base_path = path
+        else:
+            # Path without special ending
+            base_path = f"{path}/"
+
+        self._prefix = f"{parsed_url.scheme}://{parsed_url.netloc}{base_path}index-"
+        self._suffix = ".htm"
+        if parsed_url.query:
+            self._suffix += f"?{parsed_url.query}"
+
+    def page(self, page_num: int) -> str:
+        """Return the URL for the given 1-based page number."""
+        if page_num == 1:
+            return self.base_url
+        return f"{self._prefix}{page_num}{self._suffix}"
 
 def adaptive_delay(response_time: float, status_code: int) -> float:
-    """Adapt delay based on server response metrics."""
+    """Penalty delay derived from server response metrics (reactive only)."""
     # Base delay on response time (slower response = longer delay)
     base_delay = min(response_time * 1.5, 3.0)
-    
+
     # Adjust for status codes
     if status_code >= 429:  # Too Many Requests
         return base_delay * 5 + random.uniform(10, 15)  # Much longer delay
     elif status_code >= 500:  # Server error
         return base_delay * 3 + random.uniform(5, 10)  # Longer delay
-    
+
     # Add jitter to avoid detection patterns
     jitter = random.uniform(0, base_delay * 0.5)
-    
+
     return base_delay + jitter
 
-def load_progress(brand_name: str) -> Dict:
-    """Load scraping progress for a brand."""
-    progress_file = os.path.join(PROGRESS_DIR, f"{brand_name}_progress.json")
-    if os.path.exists(progress_file):
+class ProgressDB:
+    """SQLite-backed progress store for resumable scraping.
+
+    Replaces the JSON snapshot (rewritten in full every page) and the
+    replay-on-startup append log. WAL mode keeps single-row writes cheap
+    and durable; processed URLs get one batched INSERT OR IGNORE per
+    listing page, membership is an indexed point lookup, and a tiny state
+    table records the current page per brand.
+    """
+
+    def __init__(self, path: str = PROGRESS_DB):
+        os.makedirs(os.path.dirname(path), exist_ok=True)
+        # Writes are dispatched from the event loop via asyncio.to_thread,
+        # one at a time, so cross-thread use is safe here
+        self._conn = sqlite3.connect(path, check_same_thread=False)
+        self._conn.execute("PRAGMA journal_mode=WAL")
+        self._conn.execute(
+            "CREATE TABLE IF NOT EXISTS processed("
+            "url TEXT PRIMARY KEY, brand TEXT, page INTEGER)")
+        self._conn.execute(
+            "CREATE TABLE IF NOT EXISTS state("
+            "brand TEXT PRIMARY KEY, current_page INTEGER)")
+        self._conn.commit()
+
+    def is_processed(self, url: str) -> bool:
+        """Check whether a watch URL has already been scraped."""
+        row = self._conn.execute(
+            "SELECT 1 FROM processed WHERE url = ?", (url,)).fetchone()
+        return row is not None
+
+    def mark_processed(self, urls: List[str], brand_name: str, page_num: int) -> None:
+        """Record a page's worth of scraped URLs in one batched insert."""
+        if not urls:
+            return
+        self._conn.executemany(
+            "INSERT OR IGNORE INTO processed(url, brand, page) VALUES (?, ?, ?)",
+            [(url, brand_name, page_num) for url in urls])
+        self._conn.commit()
+
+    def current_page(self, brand_name: str) -> int:
+        """Return the listing page to resume from (1 for a fresh brand)."""
+        row = self._conn.execute(
+            "SELECT current_page FROM state WHERE brand = ?", (brand_name,)).fetchone()
+        return row[0] if row else 1
+
+    def set_current_page(self, brand_name: str, page_num: int) -> None:
+        """Persist the next listing page to process for a brand."""
+        self._conn.execute(
+            "INSERT INTO state(brand, current_page) VALUES (?, ?) "
+            "ON CONFLICT(brand) DO UPDATE SET current_page = excluded.current_page",
+            (brand_name, page_num))
+        self._conn.commit()
+
+    def close(self) -> None:
+        self._conn.close()
+
+class RateLimiter:
+    """Global pacing for outbound requests, shared across the event loop.
+
+    Replaces the flat 2-5s sleep per request, which serialized workers on
+    dead time regardless of how the server was doing. acquire() reserves
+    the next free slot (MIN_REQUEST_INTERVAL apart) under a lock and then
+    sleeps only its own deficit, so concurrent workers queue up instead of
+    bursting. penalize() pushes the next slot out after 429/5xx answers.
+    """
+
+    def __init__(self, min_interval: float = MIN_REQUEST_INTERVAL):
+        self.min_interval = min_interval
+        self._next_ok = 0.0
+        self._lock = asyncio.Lock()
+
+    async def acquire(self) -> None:
+        """Wait for the next request slot."""
+        async with self._lock:
+            now = time.monotonic()
+            wait = self._next_ok - now
+            self._next_ok = max(self._next_ok, now) + self.min_interval
+        if wait > 0:
+            await asyncio.sleep(wait)
+
+    def penalize(self, seconds: float) -> None:
+        """Push the next request slot out, e.g. on a 429 or server error."""
+        self._next_ok = max(self._next_ok, time.monotonic() + seconds)
+
+rate_limiter = RateLimiter()
+
+def backoff_penalty(response_time: float, status_code: int, retry_after: Optional[str]) -> float:
+    """Penalty seconds for a throttled/erroring response, honoring Retry-After."""
+    if retry_after:
         try:
-            with open(progress_file, 'r') as f:
-                return json.load(f)
-        except json.JSONDecodeError:
-            logging.error(f"Error reading progress file for {brand_name}")
-    return {"current_page": 1, "processed_urls": []}
-
-def save_progress(brand_name: str, progress: Dict):
-    """Save scraping progress for a brand."""
-    os.makedirs(PROGRESS_DIR, exist_ok=True)
-    progress_file = os.path.join(PROGRESS_DIR, f"{brand_name}_progress.json")
-    with open(progress_file, 'w') as f:
-        json.dump(progress, f)
-
-def polite_delay():
-    """Add a random delay between requests (2-5 seconds)."""
-    delay = random.uniform(2, 5)
-    time.sleep(delay)
+            return float(retry_after)
+        except ValueError:
+            pass
+    return adaptive_delay(response_time, status_code)
 
 def load_brands(filename=BRANDS_JSON):
     """Load brand data from JSON file."""
     if not os.path.exists(filename):
         logging.error(f"Brands file {filename} not found.")
         return []
-    
-    with open(filename, 'r', encoding='utf-8') as f:
-        return json.load(f)
 
-def save_watches_to_json(watches, filename=WATCHES_JSON):
-    """Save watch data to a JSON file."""
-    os.makedirs(os.path.dirname(filename), exist_ok=True)
-    
-    # Load existing watches if file exists
-    existing_watches = []
-    if os.path.exists(filename):
-        try:
-            with open(filename, 'r', encoding='utf-8') as f:
-                existing_watches = json.load(f)
-        except json.JSONDecodeError:
-            logging.error(f"Error reading existing watches file. Starting fresh.")
-    
-    # Combine existing and new watches, avoiding duplicates
-    all_watches = existing_watches.copy()
-    existing_urls = {w.get('url') for w in existing_watches}
-    
-    # Filter out watches that already exist
-    new_watches = [w for w in watches if w.get("url") not in existing_urls]
-    
-    if not new_watches:
-        logging.info("No new watches to save, skipping file write")
+    # orjson decodes the UTF-8 bytes directly
+    with open(filename, 'rb') as f:
+        return orjson.loads(f.read())
+
+# URLs already present in each JSONL output file; parsed once per process
+# and kept current by append_batch, so dedup never re-reads the file
+_KNOWN_URLS: Dict[str, Set[str]] = {}
+
+def _load_known_urls(filename: str = WATCHES_JSONL) -> Set[str]:
+    """Load an output file's URLs into _KNOWN_URLS on first use."""
+    known = _KNOWN_URLS.get(filename)
+    if known is None:
+        known = set()
+        if os.path.exists(filename):
+            with open(filename, 'rb') as f:
+                for line in f:
+                    if not line.strip():
+                        continue
+                    try:
+                        url = orjson.loads(line).get("url")
+                    except orjson.JSONDecodeError:
+                        # A crash mid-append leaves a torn final line;
+                        # skip it rather than breaking every later append
+                        continue
+                    if url:
+                        known.add(url)
+        _KNOWN_URLS[filename] = known
+    return known
+
+def _repair_torn_tail(filename: str) -> None:
+    """Terminate a torn final line left by a crash mid-append.
+
+    The load paths skip an undecodable tail, but appending right after it
+    would fuse the next record onto the torn line and corrupt both. A
+    closing newline isolates the tail so later appends stay decodable.
+    """
+    if not os.path.exists(filename):
         return
-    
-    # Add only new watches
-    all_watches.extend(new_watches)
-    
-    # Save all watches
-    with open(filename, 'w', encoding='utf-8') as f:
-        json.dump(all_watches, f, indent=2, ensure_ascii=False)
-    
-    logging.info(f"Watch data ({len(all_watches)} total watches) saved to {filename}")
+    with open(filename, 'rb+') as f:
+        f.seek(0, os.SEEK_END)
+        if f.tell() == 0:
+            return
+        f.seek(-1, os.SEEK_END)
+        if f.read(1) != b'\n':
+            f.write(b'\n')
+
+def append_batch(watches: List[Dict], filename=WATCHES_JSONL) -> int:
+    """Append a batch of watch records in one write, skipping known URLs.
+
+    Appending is O(1) per watch; the old save path re-read, re-deduped and
+    rewrote the whole JSON array on every save. Dedup runs against the
+    in-memory _KNOWN_URLS set instead of the file, and the whole batch
+    goes out as a single write. Use convert_jsonl_to_json.py for
+    consumers that need the array format. Returns how many were written.
+    """
+    known = _load_known_urls(filename)
+    new_records = [watch for watch in watches if watch.get("url") not in known]
+    if not new_records:
+        return 0
+
+    os.makedirs(os.path.dirname(filename), exist_ok=True)
+    _repair_torn_tail(filename)
+
+    with open(filename, 'ab') as f:
+        f.write(b''.join(orjson.dumps(watch) + b'\n' for watch in new_records))
+
+    known.update(watch["url"] for watch in new_records if watch.get("url"))
+    return len(new_records)
+
+def append_watch(watch: Dict, filename=WATCHES_JSONL) -> bool:
+    """Append one watch record to the JSONL output file, skipping known URLs."""
+    return append_batch([watch], filename) == 1
+
+def batched(items: List, size: int = 16):
+    """Yield items in fixed-size waves."""
+    for i in range(0, len(items), size):
+        yield items[i:i + size]
+
+@asynccontextmanager
+async def acquire_page(page_pool: asyncio.Queue):
+    """Check a page out of the pool and return it when the block exits.
+
+    Pages are pre-created in main; workers borrow them here instead of
+    calling context.new_page() in hot loops.
+    """
+    page = await page_pool.get()
+    try:
+        yield page
+    finally:
+        page_pool.put_nowait(page)
+
+def _write_text(path: str, content: str) -> None:
+    """Plain blocking text write; run via asyncio.to_thread from async code."""
+    with open(path, "w", encoding="utf-8") as f:
+        f.write(content)
 
 def make_absolute_url(url: str) -> str:
     """Convert a relative URL to an absolute URL."""
@@ -186,99 +402,38 @@ def make_absolute_url(url: str) -> str:
         return urljoin(BASE_URL, url.lstrip('/'))
     return url
 
-def extract_specs(page: Page) -> Dict[str, str]:
-    """Extract specifications from watch detail page."""
-    specs = {}
-    
-    # Try all spec table selectors in order
-    for selector in SELECTORS["SPEC_TABLES"]:
-        try:
-            tables = page.query_selector_all(selector)
-            if tables:
-                for table in tables:
-                    rows = table.query_selector_all("tbody > tr")
-                    for row in rows:
-                        key_element = row.query_selector("th") or row.query_selector("td:first-child")
-                        value_element = row.query_selector("td:last-child") or row.query_selector("td:nth-child(2)")
-                        
-                        if key_element and value_element:
-                            key = key_element.text_content().strip()
-                            value = value_element.text_content().strip()
-                            
-                            # Remove embedded JS loader code
-                            value = re.sub(r'.*function docReady[\s\S]*', '', value).strip()
-                            
-                            # Skip the generic header row
-                            key_lower = key.lower()
-                            if key_lower == "basic info":
-                                continue
-
-                            # Skip only the header-like "Description" row,
-                            # not the real description content
-                            if key_lower == "description" and value.strip().lower() == "description":
-                                continue
-                                
-                            if key:
-                                specs[key] = value
-                if specs:  # If we found specs, no need to try other selectors
-                    break
-        except Exception as e:
-            logging.warning(f"Error extracting specs with selector {selector}: {e}")
-    
-    return specs
-
-def extract_description(page: Page) -> str:
-    """Extract watch description from detail page."""
-    for selector in SELECTORS["DETAIL_DESC"]:
-        try:
-            desc_element = page.query_selector(selector)
-            if desc_element:
-                description = desc_element.text_content().strip()
-                if description:
-                    return description
-        except Exception as e:
-            logging.warning(f"Error extracting description with selector {selector}: {e}")
-    
-    return ""
-
-def process_watch_detail(page: Page, watch_url: str, brand_name: str) -> Optional[Dict]:
+async def process_watch_detail(page: Page, watch_url: str, brand_name: str) -> Optional[Dict]:
     """Process a watch detail page and extract all required information."""
     try:
         # Ensure URL is absolute
         watch_url = make_absolute_url(watch_url)
-        
+
         # Navigate to the watch detail page
-        page.goto(watch_url)
-        page.wait_for_load_state("domcontentloaded")
-        
-        # Extract watch name with fallback
-        name_element = page.query_selector(SELECTORS["DETAIL_NAME"]) or page.query_selector("h1")
-        watch_name = name_element.text_content().strip() if name_element else ""
-        
+        await rate_limiter.acquire()
+        await page.goto(watch_url)
+        await page.wait_for_load_state("domcontentloaded")
+
+        # Name, price, description and specs in one in-browser pass
+        extracted = await page.evaluate(WATCH_EXTRACT_JS, SELECTORS_COMBINED)
+        watch_name = extracted["name"]
+
         # Log and skip empty names
         if not watch_name:
             # Save HTML snapshot for debugging
             os.makedirs(ERRORS_DIR, exist_ok=True)
             path = f"{ERRORS_DIR}/empty_name_{brand_name}_{int(time.time())}.html"
-            with open(path, "w", encoding="utf-8") as f:
-                f.write(page.content())
+            await asyncio.to_thread(_write_text, path, await page.content())
             logging.warning(f"Empty watch name at {watch_url}, HTML saved to {path}")
             return None
-        
-        # Extract price
-        price_element = page.query_selector(SELECTORS["DETAIL_PRICE"])
-        price = price_element.text_content().strip() if price_element else ""
-        
-        # Extract description
-        description = extract_description(page)
-        
-        # Extract specifications
-        specs = extract_specs(page)
-        
+
+        price = extracted["price"]
+        description = extracted["description"]
+        specs = extracted["specs"]
+
         # If no top-level description, pull it from specs
         if not description and "Description" in specs:
             description = specs.pop("Description")
-        
+
         # Create watch data object
         watch_data = {
             "url": watch_url,
@@ -287,297 +442,494 @@ def process_watch_detail(page: Page, watch_url: str, brand_name: str) -> Optiona
             "description": description,
             "specifications": specs
         }
-        
+
         logging.info(f"Extracted: {watch_name} ({price})")
         return watch_data
-    
+
     except Exception as e:
         logging.error(f"Error processing watch detail page {watch_url}: {e}")
         return None
 
-def process_listing_page(page: Page) -> List[str]:
-    """Process a listing page and extract watch URLs."""
-    watch_urls = []
-    
-    logging.info("Starting to collect watch URLs from listing page...")
-    
-    # First try to get all links at once
-    try:
-        logging.info("Trying to find all watch links at once...")
-        all_links = page.query_selector_all(SELECTORS["LISTING_LINK_ALL"])
-        if all_links:
-            logging.info(f"Found {len(all_links)} links using query_selector_all")
-            for link in all_links:
-                href = link.get_attribute("href")
-                if href:
-                    absolute_url = make_absolute_url(href)
-                    watch_urls.append(absolute_url)
-                    logging.info(f"Found link: {absolute_url}")
-            return watch_urls
-    except Exception as e:
-        logging.warning(f"Error finding all links at once: {e}")
-    
-    # If that fails, try the incremental approach
-    logging.info("Falling back to incremental link collection...")
-    n = 1
-    while True:
-        selector = f"#wt-watches > div:nth-child({n}) > a"
-        try:
-            link = page.query_selector(selector)
-            if not link:
-                logging.info(f"No more watch links found after {n-1} links")
-                break
-                
-            href = link.get_attribute("href")
-            if href:
-                absolute_url = make_absolute_url(href)
-                watch_urls.append(absolute_url)
-                logging.info(f"Found watch URL {n}: {absolute_url}")
-            n += 1
-        except Exception as e:
-            logging.error(f"Error extracting watch URL {n}: {e}")
-            break
-    
+async def process_listing_page(page: Page) -> List[str]:
+    """Collect all watch URLs from a rendered listing page.
+
+    One evaluate call pulls every href in a single round-trip; the old
+    implementation walked nth-child selectors one query_selector (and one
+    IPC) at a time.
+    """
+    hrefs = await page.evaluate(
+        "(sel) => [...document.querySelectorAll(sel)].map(a => a.href)",
+        SELECTORS["LISTING_LINK_ALL"])
+    watch_urls = [make_absolute_url(href) for href in hrefs if href]
+
     if not watch_urls:
-        logging.error("No links found. Page content:")
-        logging.error(page.content())
-    
-    logging.info(f"Total watch URLs collected from page: {len(watch_urls)}")
+        logging.warning("No watch links found on listing page")
+    else:
+        logging.info(f"Collected {len(watch_urls)} watch URLs from listing page")
+    return watch_urls
+
+@with_retry(max_retries=3)
+async def fetch_listing(client: httpx.AsyncClient, url: str) -> List[str]:
+    """Fetch a listing page over plain HTTP and extract watch URLs.
+
+    Listing markup is server-rendered, so a lightweight GET plus selectolax
+    covers the common case without spending a browser navigation on it. The
+    browser listing path stays as fallback for JS-rendered variants.
+    """
+    await rate_limiter.acquire()
+    start_time = time.time()
+    response = await client.get(url)
+    response_time = time.time() - start_time
+    if response.status_code == 429 or response.status_code >= 500:
+        rate_limiter.penalize(backoff_penalty(
+            response_time, response.status_code, response.headers.get("Retry-After")))
+    response.raise_for_status()
+
+    watch_urls: List[str] = []
+    tree = HTMLParser(response.text)
+    for link in tree.css(SELECTORS["LISTING_LINK_ALL"]):
+        href = link.attributes.get("href")
+        if href:
+            absolute_url = make_absolute_url(href)
+            if absolute_url not in watch_urls:
+                watch_urls.append(absolute_url)
+
     return watch_urls
 
-def smoke_test_selectors(page: Page, brand: Dict) -> bool:
+def parse_watch_detail(html: str, watch_url: str) -> Optional[Dict]:
+    """Parse a fetched detail page into a watch record.
+
+    Mirrors WATCH_EXTRACT_JS for statically rendered pages. Returns None
+    when no name can be found so the caller can retry in the browser.
+    """
+    tree = HTMLParser(html)
+
+    def text(query: str) -> str:
+        node = tree.css_first(query)
+        return node.text(strip=True) if node else ''
+
+    watch_name = text(SELECTORS["DETAIL_NAME"]) or text("h1")
+    if not watch_name:
+        return None
+
+    price = text(SELECTORS["DETAIL_PRICE"])
+
+    description = text(SELECTORS_COMBINED["DETAIL_DESC"])
+
+    # One combined-selector pass; a table matched by several variants just
+    # re-assigns the same keys, so no explicit dedup is needed
+    specs = {}
+    for table in tree.css(SELECTORS_COMBINED["SPEC_TABLES"]):
+        for row in table.css('tbody > tr'):
+            key_node = row.css_first('th, td:first-child')
+            value_node = row.css_first('td:last-child, td:nth-child(2)')
+            key = key_node.text(strip=True) if key_node else ''
+            value = value_node.text(strip=True) if value_node else ''
+
+            # Remove embedded JS loader code, as in the in-browser pass
+            loader_at = value.find('function docReady')
+            if loader_at >= 0:
+                value = value[:loader_at].strip()
+
+            key_lower = key.lower()
+            if key_lower == 'basic info':
+                continue
+            if key_lower == 'description' and value.lower() == 'description':
+                continue
+
+            if key:
+                specs[key] = value
+
+    # If no top-level description, pull it from specs
+    if not description and "Description" in specs:
+        description = specs.pop("Description")
+
+    return {
+        "url": watch_url,
+        "name": watch_name,
+        "price": price,
+        "description": description,
+        "specifications": specs
+    }
+
+async def fetch_watch_detail(client: httpx.AsyncClient, watch_url: str) -> Optional[Dict]:
+    """Fetch and parse a watch detail page over plain HTTP.
+
+    Returns None on any failure or an empty name; the caller then falls
+    back to a browser page, which also owns the HTML-snapshot debugging.
+    """
+    watch_url = make_absolute_url(watch_url)
+    try:
+        await rate_limiter.acquire()
+        start_time = time.time()
+        response = await client.get(watch_url)
+        response_time = time.time() - start_time
+        if response.status_code == 429 or response.status_code >= 500:
+            rate_limiter.penalize(backoff_penalty(
+                response_time, response.status_code, response.headers.get("Retry-After")))
+        response.raise_for_status()
+    except Exception as e:
+        logging.warning(f"HTTP detail fetch failed for {watch_url}: {e}")
+        return None
+
+    watch_data = parse_watch_detail(response.text, watch_url)
+    if watch_data:
+        logging.info(f"Extracted: {watch_data['name']} ({watch_data['price']})")
+    return watch_data
+
+async def smoke_test_selectors(page: Page, brand: Dict) -> bool:
     """Test if all required selectors are working on a sample page."""
     try:
         # Load first page
-        page.goto(brand["url"])
-        page.wait_for_load_state("domcontentloaded")
-        
+        await page.goto(brand["url"])
+        await page.wait_for_load_state("domcontentloaded")
+
         # Wait for watch container
         try:
-            page.wait_for_selector(SELECTORS["LISTING_CONTAINER"], timeout=30000)
+            await page.wait_for_selector(SELECTORS["LISTING_CONTAINER"], timeout=30000)
         except TimeoutError:
             logging.error("Selector LISTING_CONTAINER failed on sample page")
             return False
-        
+
         # Test listing link selector
-        if not page.query_selector(SELECTORS["LISTING_LINK"]):
+        if not await page.query_selector(SELECTORS["LISTING_LINK"]):
             logging.error("Selector LISTING_LINK failed on sample page")
             return False
-        
+
         # Get first watch URL
-        first_link = page.query_selector(SELECTORS["LISTING_LINK"])
+        first_link = await page.query_selector(SELECTORS["LISTING_LINK"])
         if not first_link:
             logging.error("Could not find first watch link")
             return False
-        
-        watch_url = make_absolute_url(first_link.get_attribute("href"))
-        
+
+        watch_url = make_absolute_url(await first_link.get_attribute("href"))
+
         # Test detail page selectors
-        page.goto(watch_url)
-        page.wait_for_load_state("domcontentloaded")
-        
-        if not page.query_selector(SELECTORS["DETAIL_NAME"]):
+        await page.goto(watch_url)
+        await page.wait_for_load_state("domcontentloaded")
+
+        if not await page.query_selector(SELECTORS["DETAIL_NAME"]):
             logging.error("Selector DETAIL_NAME failed on sample page")
             return False
-            
-        if not page.query_selector(SELECTORS["DETAIL_PRICE"]):
+
+        if not await page.query_selector(SELECTORS["DETAIL_PRICE"]):
             logging.error("Selector DETAIL_PRICE failed on sample page")
             return False
-            
-        if not any(page.query_selector(selector) for selector in SELECTORS["SPEC_TABLES"]):
+
+        spec_hits = [await page.query_selector(selector) for selector in SELECTORS["SPEC_TABLES"]]
+        if not any(spec_hits):
             logging.error("All SPEC_TABLES selectors failed on sample page")
             return False
-        
+
         return True
-        
+
     except Exception as e:
         logging.error(f"Error during smoke test: {e}")
         return False
 
 @with_retry(max_retries=3)
-def process_brand_page(page: Page, brand: Dict, page_num: int) -> bool:
+async def process_brand_page(page: Page, brand: Dict, pagination: PaginationURL,
+                             page_num: int) -> bool:
     """Process a single page of brand listings with retry logic."""
-    current_url = get_pagination_url(brand["url"], page_num)
-    
+    current_url = pagination.page(page_num)
+
     logging.info(f"\nProcessing page {page_num}: {current_url}")
-    
+
     # Navigate to the page
+    await rate_limiter.acquire()
     start_time = time.time()
-    response = page.goto(current_url, wait_until="networkidle")
+    # domcontentloaded plus the container wait below is all we need;
+    # networkidle waited out trackers and lazy assets we don't read
+    response = await page.goto(current_url, wait_until="domcontentloaded")
     response_time = time.time() - start_time
-    
+
     if not response or response.status != 200:
         logging.error(f"Failed to load page {page_num}")
         logging.error(f"Response status: {response.status if response else 'No response'}")
+        if response and (response.status == 429 or response.status >= 500):
+            rate_limiter.penalize(backoff_penalty(
+                response_time, response.status, response.headers.get("retry-after")))
         return False
-    
+
     # Wait for the page to be fully loaded
     try:
-        page.wait_for_selector(SELECTORS["LISTING_CONTAINER"], timeout=30000)
+        await page.wait_for_selector(SELECTORS["LISTING_CONTAINER"], timeout=30000)
     except TimeoutError:
         logging.error(f"Watch container not found on page {page_num}")
         # Take screenshot of error
         os.makedirs(ERRORS_DIR, exist_ok=True)
         screenshot_path = f"{ERRORS_DIR}/screenshot_{brand['name']}_{page_num}.png"
-        page.screenshot(path=screenshot_path)
+        await page.screenshot(path=screenshot_path)
         logging.error(f"Screenshot saved to {screenshot_path}")
         return False
-    
-    # Apply adaptive delay based on response time and status
-    delay = adaptive_delay(response_time, response.status)
-    time.sleep(delay)
-    
+
     return True
 
-def process_brand(page: Page, brand: Dict) -> List[Dict]:
+async def process_brand(client: httpx.AsyncClient, listing_page: Page,
+                        page_pool: asyncio.Queue, sem: asyncio.Semaphore,
+                        brand: Dict, progress_db: ProgressDB,
+                        output_file: str = WATCHES_JSONL) -> List[Dict]:
     """Process a single brand's watches with progress tracking and recovery."""
     brand_watches = []
-    
-    # Load progress
-    progress = load_progress(brand["name"])
-    start_page = progress.get("current_page", 1)
-    processed_urls = set(progress.get("processed_urls", []))
-    
+    brand_name = brand["name"]
+    start_page = progress_db.current_page(brand_name)
+
+    async def process_watch(url: str) -> Optional[Dict]:
+        """Fetch one watch detail page, HTTP-first with a browser fallback."""
+        async with sem:
+            watch_data = await fetch_watch_detail(client, url)
+            if watch_data is None:
+                # JS-rendered or blocked page: retry on a pooled browser page
+                async with acquire_page(page_pool) as page:
+                    watch_data = await process_watch_detail(page, url, brand_name)
+        return watch_data
+
     try:
-        logging.info(f"\nProcessing brand: {brand['name']}")
-        
+        logging.info(f"\nProcessing brand: {brand_name}")
+
+        # Parse the brand URL once for the whole pagination loop
+        pagination = PaginationURL(brand["url"])
+
         for page_num in range(start_page, 100):  # Limit to 100 pages max
-            # Process the page
-            if not process_brand_page(page, brand, page_num):
-                logging.warning(f"Failed to process page {page_num}, stopping pagination")
-                break
-            
-            # Get watch URLs
-            watch_urls = process_listing_page(page)
+            # Fetch the listing over HTTP first; the browser only steps in
+            # when the static HTML carries no links
+            try:
+                watch_urls = await fetch_listing(client, pagination.page(page_num))
+            except Exception as e:
+                logging.warning(f"HTTP listing fetch failed for page {page_num}: {e}")
+                watch_urls = []
+
+            if not watch_urls:
+                if not await process_brand_page(listing_page, brand, pagination, page_num):
+                    logging.warning(f"Failed to process page {page_num}, stopping pagination")
+                    break
+                watch_urls = await process_listing_page(listing_page)
+
             if not watch_urls:
                 logging.info(f"No watches found on page {page_num}")
                 break
-            
+
             # Filter out already processed URLs
-            new_urls = [url for url in watch_urls if url not in processed_urls]
+            new_urls = [url for url in watch_urls if not progress_db.is_processed(url)]
             if not new_urls:
                 logging.info(f"No new watches found on page {page_num}, stopping pagination")
                 break
-            
+
             logging.info(f"Found {len(new_urls)} new watches on page {page_num}")
-            
-            # Process each new watch
-            for i, url in enumerate(new_urls, 1):
-                try:
-                    logging.info(f"\nProcessing watch {i}/{len(new_urls)} on page {page_num}")
-                    watch_data = process_watch_detail(page, url, brand["name"])
-                    if watch_data:
-                        brand_watches.append(watch_data)
-                        # Save incrementally after each successful watch
-                        save_watches_to_json([watch_data])
-                        # Update processed URLs
-                        processed_urls.add(url)
-                        # Save progress
-                        save_progress(brand["name"], {
-                            "current_page": page_num,
-                            "processed_urls": list(processed_urls)
-                        })
-                    polite_delay()  # Add delay between watch detail requests
-                except Exception as e:
-                    logging.error(f"Error processing watch {url}: {e}")
-                    continue
-            
-            # Save progress after each page
-            save_progress(brand["name"], {
-                "current_page": page_num + 1,  # Next page
-                "processed_urls": list(processed_urls)
-            })
-        
-        logging.info(f"\nFinished processing {brand['name']}. Total watches: {len(brand_watches)}")
+
+            # Fan the watches out in fixed-size waves; the semaphore bounds
+            # how many detail pages are in flight, and each wave lands in
+            # the output file as one write instead of one per watch
+            done_urls = []
+            for wave in batched(new_urls):
+                results = await asyncio.gather(
+                    *(process_watch(url) for url in wave),
+                    return_exceptions=True
+                )
+                wave_watches = []
+                for url, result in zip(wave, results):
+                    if isinstance(result, Exception):
+                        logging.error(f"Error processing watch {url}: {result}")
+                    elif result:
+                        wave_watches.append(result)
+                        done_urls.append(url)
+
+                if wave_watches:
+                    brand_watches.extend(wave_watches)
+                    await asyncio.to_thread(append_batch, wave_watches, output_file)
+
+            # One batched insert per page, then advance the resume point;
+            # both commits run off-loop
+            await asyncio.to_thread(progress_db.mark_processed, done_urls, brand_name, page_num)
+            await asyncio.to_thread(progress_db.set_current_page, brand_name, page_num + 1)
+
+        logging.info(f"\nFinished processing {brand_name}. Total watches: {len(brand_watches)}")
         return brand_watches
-        
+
     except Exception as e:
-        logging.error(f"Error processing brand {brand['name']}: {e}")
-        # Save progress for later resumption
-        save_progress(brand["name"], {
-            "current_page": page_num,
-            "processed_urls": list(processed_urls)
-        })
+        logging.error(f"Error processing brand {brand_name}: {e}")
         return brand_watches
 
+def brand_output_file(brand_name: str) -> str:
+    """Per-brand JSONL output path, written by that brand's worker only."""
+    return os.path.join(DATA_DIR, f"{brand_name}.jsonl")
+
+def brand_storage_state_file(brand_name: str) -> str:
+    """Per-brand storage state path, so workers never rewrite a shared file."""
+    return os.path.join(DATA_DIR, f"storage_state_{brand_name}.json")
+
+async def scrape_brand(brand: Dict, headless: bool, slow_mo: int,
+                       max_concurrent: int, worker_count: int) -> None:
+    """Scrape one brand end to end inside its own event loop."""
+    global rate_limiter
+    # Scale the per-process interval by the number of workers so the
+    # aggregate request rate against the host stays bounded
+    rate_limiter = RateLimiter(MIN_REQUEST_INTERVAL * worker_count)
+
+    output_file = brand_output_file(brand["name"])
+    storage_state_file = brand_storage_state_file(brand["name"])
+
+    # Launch Playwright browser
+    async with async_playwright() as pw:
+        browser = await pw.chromium.launch(
+            headless=headless,
+            slow_mo=slow_mo
+        )
+
+        # Create one browser context for the whole run, restoring cookies
+        # from the previous run so bot checks and consent don't re-trigger;
+        # an unreadable state file just means starting from a fresh context
+        try:
+            context = await browser.new_context(
+                storage_state=storage_state_file if os.path.exists(storage_state_file) else None,
+                viewport={"width": 1920, "height": 1080},
+                user_agent=USER_AGENT
+            )
+        except Exception as e:
+            logging.warning(f"Could not restore storage state from {storage_state_file}: {e}")
+            context = await browser.new_context(
+                viewport={"width": 1920, "height": 1080},
+                user_agent=USER_AGENT
+            )
+
+        # Block images, fonts, styles and trackers for every page in the context
+        await context.route("**/*", abort_unneeded_resources)
+
+        # Dedicated page for listing pagination plus a pool for detail pages
+        listing_page = await context.new_page()
+        sem = asyncio.Semaphore(max_concurrent)
+        page_pool: asyncio.Queue = asyncio.Queue()
+        for _ in range(max_concurrent):
+            await page_pool.put(await context.new_page())
+
+        # Shared HTTP client for listing pages
+        client = httpx.AsyncClient(http2=True, headers=HTTP_HEADERS,
+                                   follow_redirects=True, timeout=30.0)
+
+        # Durable progress (processed URLs + resume page); WAL mode keeps
+        # the shared database safe across brand workers
+        progress_db = ProgressDB()
+
+        try:
+            # Run smoke test before processing
+            if not await smoke_test_selectors(listing_page, brand):
+                logging.error(f"Smoke test failed for {brand['name']}. Aborting this brand.")
+                return
+
+            brand_watches = await process_brand(client, listing_page, page_pool, sem,
+                                                brand, progress_db, output_file)
+
+            # Watches are appended to the per-brand JSONL file as scraped
+            if brand_watches:
+                logging.info(f"Extracted {len(brand_watches)} {brand['name']} watches")
+            else:
+                logging.warning(f"No {brand['name']} watches were extracted")
+
+        except Exception as e:
+            logging.error(f"Error scraping brand {brand['name']}: {e}")
+
+        finally:
+            progress_db.close()
+            await client.aclose()
+            # Persist cookies/session for the next run, then clean up
+            try:
+                await context.storage_state(path=storage_state_file)
+            except Exception as e:
+                logging.warning(f"Could not save storage state: {e}")
+            await context.close()
+            await browser.close()
+
+def run_brand_worker(brand: Dict, headless: bool, slow_mo: int,
+                     max_concurrent: int, worker_count: int) -> None:
+    """Process entry point: one brand, one event loop, one output file."""
+    asyncio.run(scrape_brand(brand, headless, slow_mo, max_concurrent, worker_count))
+
+def merge_brand_outputs(brand_names: List[str], filename: str = WATCHES_JSONL) -> int:
+    """Merge per-brand JSONL files into the combined output, deduped by URL."""
+    known = _load_known_urls(filename)
+    merged = 0
+    os.makedirs(os.path.dirname(filename), exist_ok=True)
+    _repair_torn_tail(filename)
+    with open(filename, 'ab') as out:
+        for brand_name in brand_names:
+            brand_file = brand_output_file(brand_name)
+            if not os.path.exists(brand_file):
+                continue
+            with open(brand_file, 'rb') as f:
+                for line in f:
+                    if not line.strip():
+                        continue
+                    try:
+                        url = orjson.loads(line).get("url")
+                    except orjson.JSONDecodeError:
+                        logging.warning(f"Skipping undecodable line in {brand_file}")
+                        continue
+                    if url and url in known:
+                        continue
+                    out.write(line if line.endswith(b'\n') else line + b'\n')
+                    if url:
+                        known.add(url)
+                    merged += 1
+    return merged
+
 def main():
-    """Main function to orchestrate the watch extraction process."""
+    """Coordinate one scraping process per brand and merge their output."""
     # Parse command line arguments
-    parser = argparse.ArgumentParser(description='Scrape Rolex watches from Chrono24')
-    parser.add_argument('--headless', action='store_true', default=True, 
+    parser = argparse.ArgumentParser(description='Scrape watches from Chrono24')
+    parser.add_argument('--headless', action='store_true', default=True,
                         help='Run browser in headless mode')
-    parser.add_argument('--slow-mo', type=int, default=0, 
+    parser.add_argument('--slow-mo', type=int, default=0,
                         help='Slow down browser actions by specified milliseconds')
     parser.add_argument('--max-concurrent', type=int, default=3,
                         help='Maximum number of concurrent watch detail page processing')
+    parser.add_argument('--brands', default='Rolex',
+                        help='Comma-separated brand names to scrape in parallel')
     args = parser.parse_args()
-    
+
     # Create necessary directories
     os.makedirs(DATA_DIR, exist_ok=True)
     os.makedirs(ERRORS_DIR, exist_ok=True)
-    os.makedirs(PROGRESS_DIR, exist_ok=True)
-    
+
     # Load brands
     brands = load_brands()
     if not brands:
         logging.error("No brands found. Please run extract_brands.py first.")
         return
-    
+
     logging.info(f"Loaded {len(brands)} brands")
-    
-    # Initialize watches list
-    all_watches = []
-    
-    # Launch Playwright browser
-    with sync_playwright() as pw:
-        browser = pw.chromium.launch(
-            headless=args.headless,
-            slow_mo=args.slow_mo
-        )
-        
-        # Create a new browser context with a realistic viewport
-        context = browser.new_context(
-            viewport={"width": 1920, "height": 1080},
-            user_agent="Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/91.0.4472.124 Safari/537.36"
-        )
-        
-        # Create a new page
-        page = context.new_page()
-        
-        try:
-            # Find the main Rolex brand page
-            rolex_brand = next((brand for brand in brands if brand["name"] == "Rolex"), None)
-            if not rolex_brand:
-                logging.error("Rolex brand not found in brands list")
-                return
-                
-            logging.info(f"\nProcessing Rolex watches...")
-            
-            # Run smoke test before processing
-            if not smoke_test_selectors(page, rolex_brand):
-                logging.error("Smoke test failed. Aborting.")
-                sys.exit(1)
-            
-            brand_watches = process_brand(page, rolex_brand)
-            all_watches.extend(brand_watches)
-            
-            # Save after processing
-            if brand_watches:
-                save_watches_to_json(all_watches)
-                logging.info(f"Extracted {len(all_watches)} Rolex watches")
-            else:
-                logging.warning("No Rolex watches were extracted")
-        
-        except Exception as e:
-            logging.error(f"Error in main process: {e}")
-            # Save whatever watches we've collected so far
-            if all_watches:
-                save_watches_to_json(all_watches)
-        
-        finally:
-            # Clean up
-            context.close()
-            browser.close()
+
+    wanted = [name.strip() for name in args.brands.split(',') if name.strip()]
+    selected = [brand for brand in brands if brand["name"] in wanted]
+    for name in wanted:
+        if not any(brand["name"] == name for brand in selected):
+            logging.error(f"Brand {name} not found in brands list")
+    if not selected:
+        return
+
+    if len(selected) == 1:
+        # Single brand: no child process needed
+        run_brand_worker(selected[0], args.headless, args.slow_mo,
+                         args.max_concurrent, 1)
+    else:
+        # One process per brand, each with its own event loop and browser;
+        # spawn keeps the children free of inherited loop/browser state
+        ctx = multiprocessing.get_context("spawn")
+        workers = []
+        for brand in selected:
+            worker = ctx.Process(
+                target=run_brand_worker,
+                args=(brand, args.headless, args.slow_mo,
+                      args.max_concurrent, len(selected)),
+                name=f"scrape-{brand['name']}"
+            )
+            worker.start()
+            workers.append(worker)
+        for worker in workers:
+            worker.join()
+
+    # Fold the per-brand files into the combined output
+    merged = merge_brand_outputs([brand["name"] for brand in selected])
+    logging.info(f"Merged {merged} new watches into {WATCHES_JSONL}")
 
 if __name__ == "__main__":
-    main() 
\ No newline at end of file
+    main()